@@ -22,9 +22,11 @@
 
 #pragma once
 #include <bitset>
+#include <cstdint>
 
 // Reorders VkDynamicState so it can be a bitset
-typedef enum CBDynamicState {
+// Kept unscoped so values can index CBDynamicFlags directly, uint8_t keeps the lookup tables small
+enum CBDynamicState : uint8_t {
     CB_DYNAMIC_STATE_VIEWPORT = 1,
     CB_DYNAMIC_STATE_SCISSOR = 2,
     CB_DYNAMIC_STATE_LINE_WIDTH = 3,
@@ -98,7 +100,7 @@ typedef enum CBDynamicState {
     CB_DYNAMIC_STATE_COVERAGE_REDUCTION_MODE_NV = 71,
     CB_DYNAMIC_STATE_ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT = 72,
     CB_DYNAMIC_STATE_STATUS_NUM = 73
-} CBDynamicState;
+};
 
 using CBDynamicFlags = std::bitset<CB_DYNAMIC_STATE_STATUS_NUM>;
 CBDynamicState ConvertToCBDynamicState(VkDynamicState dynamic_state);
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 from generator import *
 from common_codegen import *
@@ -21,6 +22,42 @@ from common_codegen import *
 # This is a workaround to use a Python 2.7 and 3.x compatible syntax
 from io import open
 
+_FILE_COMMENT = '''// *** THIS FILE IS GENERATED - DO NOT EDIT ***
+// See dynamic_state_generator.py for modifications
+'''
+
+_COPYRIGHT_BANNER = '''
+/***************************************************************************
+ *
+ * Copyright (c) 2023 Valve Corporation
+ * Copyright (c) 2023 LunarG, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ****************************************************************************/
+'''
+
+_HEADER_PRELUDE = f'''{_FILE_COMMENT}
+{_COPYRIGHT_BANNER}
+#pragma once
+#include <bitset>
+#include <cstdint>'''
+
+_SOURCE_PRELUDE = f'''{_FILE_COMMENT}
+{_COPYRIGHT_BANNER}
+#include "core_checks/core_validation.h"
+#include <algorithm>
+#include <array>'''
+
 class DynamicStateOutputGeneratorOptions(GeneratorOptions):
     def __init__(self,
                  conventions = None,
@@ -38,16 +75,7 @@ class DynamicStateOutputGeneratorOptions(GeneratorOptions):
                  emitSpirv = None,
                  emitFormats = None,
                  sortProcedure = regSortFeatures,
-                 genFuncPointers = True,
-                 protectFile = True,
-                 protectFeature = False,
-                 apicall = 'VKAPI_ATTR ',
-                 apientry = 'VKAPI_CALL ',
-                 apientryp = 'VKAPI_PTR *',
-                 indentFuncProto = True,
-                 indentFuncPointer = False,
-                 alignFuncParam = 48,
-                 expandEnumerants = False):
+                 sourceFilename = None):
         GeneratorOptions.__init__(self,
                 conventions = conventions,
                 filename = filename,
@@ -64,16 +92,7 @@ class DynamicStateOutputGeneratorOptions(GeneratorOptions):
                 emitSpirv = emitSpirv,
                 emitFormats = emitFormats,
                 sortProcedure = sortProcedure)
-        self.genFuncPointers = genFuncPointers
-        self.protectFile     = protectFile
-        self.protectFeature  = protectFeature
-        self.apicall         = apicall
-        self.apientry        = apientry
-        self.apientryp       = apientryp
-        self.indentFuncProto = indentFuncProto
-        self.indentFuncPointer = indentFuncPointer
-        self.alignFuncParam  = alignFuncParam
-        self.expandEnumerants = expandEnumerants
+        self.sourceFilename = sourceFilename # Also write this source file when generating the header
 #
 # DynamicStateOutputGenerator - Generate SPIR-V validation
 # for SPIR-V extensions and capabilities
@@ -87,6 +106,7 @@ class DynamicStateOutputGenerator(OutputGenerator):
         self.sourceFile = False # Source file generation flag
 
         self.dynamic_states = [] # VkDynamicState enum values
+        self.dynamic_state_pairs = [] # (VkDynamicState, CBDynamicState suffix) tuples
 
     #
     # Called at beginning of processing as file is opened
@@ -95,44 +115,20 @@ class DynamicStateOutputGenerator(OutputGenerator):
         self.headerFile = (genOpts.filename == 'dynamic_state_helper.h')
         self.sourceFile = (genOpts.filename == 'dynamic_state_helper.cpp')
 
-        # File Comment
-        file_comment = '// *** THIS FILE IS GENERATED - DO NOT EDIT ***\n'
-        file_comment += '// See dynamic_state_generator.py for modifications\n'
-        write(file_comment, file=self.outFile)
-        # Copyright Statement
-        copyright = ''
-        copyright += '\n'
-        copyright += '/***************************************************************************\n'
-        copyright += ' *\n'
-        copyright += ' * Copyright (c) 2023 Valve Corporation\n'
-        copyright += ' * Copyright (c) 2023 LunarG, Inc.\n'
-        copyright += ' *\n'
-        copyright += ' * Licensed under the Apache License, Version 2.0 (the "License");\n'
-        copyright += ' * you may not use this file except in compliance with the License.\n'
-        copyright += ' * You may obtain a copy of the License at\n'
-        copyright += ' *\n'
-        copyright += ' *     http://www.apache.org/licenses/LICENSE-2.0\n'
-        copyright += ' *\n'
-        copyright += ' * Unless required by applicable law or agreed to in writing, software\n'
-        copyright += ' * distributed under the License is distributed on an "AS IS" BASIS,\n'
-        copyright += ' * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.\n'
-        copyright += ' * See the License for the specific language governing permissions and\n'
-        copyright += ' * limitations under the License.\n'
-        copyright += ' ****************************************************************************/\n'
-        write(copyright, file=self.outFile)
-        if self.sourceFile:
-            write('#include "core_checks/core_validation.h"', file=self.outFile)
-        elif self.headerFile:
-            write('#pragma once', file=self.outFile)
-            write('#include <bitset>', file=self.outFile)
+        write(_HEADER_PRELUDE if self.headerFile else _SOURCE_PRELUDE, file=self.outFile)
 
     #
     # Write generated file content to output file
     def endFile(self):
         if self.headerFile:
-            write(self.dynamicTypeEnum(), file=self.outFile)
+            self.dynamicTypeEnum(self.outFile)
+            if self.genOpts.sourceFilename:
+                # The source only needs the same VkDynamicState walk, so write it from this run as well
+                with open(os.path.join(self.genOpts.directory, self.genOpts.sourceFilename), mode='w', encoding='utf-8', newline='\n') as fd:
+                    write(_SOURCE_PRELUDE, file=fd)
+                    self.dynamicFunction(fd)
         elif self.sourceFile:
-            write(self.dynamicFunction(), file=self.outFile)
+            self.dynamicFunction(self.outFile)
         # Finish processing in superclass
         OutputGenerator.endFile(self)
 
@@ -140,78 +136,124 @@ class DynamicStateOutputGenerator(OutputGenerator):
     # List the enum for the commands
     def genGroup(self, groupinfo, name, alias):
         if (name == 'VkDynamicState'):
-            for elem in groupinfo.elem.findall('enum'):
-                if elem.get('alias') is None:
-                    self.dynamic_states.append(elem.get('name'))
+            # Names are interned since every generated table repeats them
+            self.dynamic_states.extend(sys.intern(elem.get('name')) for elem in groupinfo.elem.iterfind('enum') if elem.get('alias') is None)
+            # VK_DYNAMIC_STATE_LINE_WIDTH -> STATE_LINE_WIDTH
+            self.dynamic_state_pairs = [(n, sys.intern(n[11:])) for n in self.dynamic_states]
+            # CBDynamicState has a uint8_t underlying type, and CB_DYNAMIC_STATE_STATUS_NUM must fit in it too
+            if len(self.dynamic_state_pairs) + 1 > 255:
+                print("Error: Too many VkDynamicState values for the uint8_t CBDynamicState, widen its underlying type.\n")
+                sys.exit(1)
 
     #
     # List the enum for the dynamic command buffer status flags
-    def dynamicTypeEnum(self):
-        output = '''
+    def dynamicTypeEnum(self, out):
+        out.write('''
 // Reorders VkDynamicState so it can be a bitset
-typedef enum CBDynamicState {\n'''
-        counter = 1
-        for name in self.dynamic_states:
-            state_name = name[11:] # VK_DYNAMIC_STATE_LINE_WIDTH -> STATE_LINE_WIDTH
-            output += '    CB_DYNAMIC_{} = {},\n'.format(state_name, str(counter))
-            counter += 1
-
-        output += '    CB_DYNAMIC_STATE_STATUS_NUM = ' + str(counter)
-        output += '''
-} CBDynamicState;
+// Kept unscoped so values can index CBDynamicFlags directly, uint8_t keeps the lookup tables small
+enum CBDynamicState : uint8_t {\n''')
+        out.write(''.join(f'    CB_DYNAMIC_{state_name} = {counter},\n'
+                          for counter, (name, state_name) in enumerate(self.dynamic_state_pairs, start=1)))
+        out.write(f'    CB_DYNAMIC_STATE_STATUS_NUM = {len(self.dynamic_state_pairs) + 1}')
+        out.write('''
+};
 
 using CBDynamicFlags = std::bitset<CB_DYNAMIC_STATE_STATUS_NUM>;
 CBDynamicState ConvertToCBDynamicState(VkDynamicState dynamic_state);
 const char* DynamicStateToString(CBDynamicState dynamic_state);
 std::string DynamicStatesToString(CBDynamicFlags const &dynamic_states);
-'''
-        return output
+
+''')
 
     #
     # List the enum for the dynamic command buffer status flags
-    def dynamicFunction(self):
-        output = '''
-static VkDynamicState ConvertToDynamicState(CBDynamicState dynamic_state) {
-    switch (dynamic_state) {\n'''
-        for name in self.dynamic_states:
-            state_name = name[11:] # VK_DYNAMIC_STATE_LINE_WIDTH -> STATE_LINE_WIDTH
-            output += '        case CB_DYNAMIC_{}:\n'.format(state_name)
-            output += '            return {};\n'.format(name)
-        output += '''        default:
-            return VK_DYNAMIC_STATE_MAX_ENUM;
+    def dynamicFunction(self, out):
+        to_cb_entries = ''.join(f'    {{{name}, CB_DYNAMIC_{state_name}}},\n' for name, state_name in self.dynamic_state_pairs)
+        # Both tables are indexed by CBDynamicState, which starts at 1
+        to_vk_entries = ',\n    '.join(['VK_DYNAMIC_STATE_MAX_ENUM'] + self.dynamic_states)
+        name_entries = ',\n    '.join(f'"{name}"' for name in ['Unhandled VkDynamicState'] + self.dynamic_states)
+
+        out.write('''
+// Indexed directly by CBDynamicState, enum is not zero based
+static constexpr std::array<VkDynamicState, CB_DYNAMIC_STATE_STATUS_NUM> kCBToVk = {{
+    ''')
+        out.write(to_vk_entries)
+        out.write('''
+}};
+
+[[maybe_unused]] static VkDynamicState ConvertToDynamicState(CBDynamicState dynamic_state) {
+    return (static_cast<size_t>(dynamic_state) < kCBToVk.size()) ? kCBToVk[dynamic_state] : VK_DYNAMIC_STATE_MAX_ENUM;
+}
+''')
+        out.write('''
+struct VkToCBEntry {
+    VkDynamicState vk_state;
+    CBDynamicState cb_state;
+};
+\n''')
+        out.write(f'using VkToCBTable = std::array<VkToCBEntry, {len(self.dynamic_state_pairs)}>;\n')
+        out.write('''
+// VkDynamicState values are not dense, so sort them at compile time and binary search
+static constexpr VkToCBTable SortByVkDynamicState(VkToCBTable table) {
+    for (size_t i = 1; i < table.size(); ++i) {
+        const VkToCBEntry entry = table[i];
+        size_t j = i;
+        for (; j > 0 && entry.vk_state < table[j - 1].vk_state; --j) {
+            table[j] = table[j - 1];
+        }
+        table[j] = entry;
     }
+    return table;
 }
-'''
-        output += '''
+
+static constexpr VkToCBTable kVkToCB = SortByVkDynamicState({{
+''')
+        out.write(to_cb_entries)
+        out.write('''}});
+
 CBDynamicState ConvertToCBDynamicState(VkDynamicState dynamic_state) {
-    switch (dynamic_state) {\n'''
-        for name in self.dynamic_states:
-            state_name = name[11:] # VK_DYNAMIC_STATE_LINE_WIDTH -> STATE_LINE_WIDTH
-            output += '        case {}:\n'.format(name)
-            output += '            return CB_DYNAMIC_{};\n'.format(state_name)
-        output += '''        default:
-            return CB_DYNAMIC_STATE_STATUS_NUM;
-    }
+    const auto it = std::lower_bound(kVkToCB.begin(), kVkToCB.end(), dynamic_state,
+                                     [](const VkToCBEntry &entry, VkDynamicState value) { return entry.vk_state < value; });
+    return (it != kVkToCB.end() && it->vk_state == dynamic_state) ? it->cb_state : CB_DYNAMIC_STATE_STATUS_NUM;
 }
-'''
+''')
+
+        out.write('''
+// Indexed directly by CBDynamicState, entry 0 matches string_VkDynamicState(VK_DYNAMIC_STATE_MAX_ENUM)
+static constexpr std::array<const char*, CB_DYNAMIC_STATE_STATUS_NUM> kCBDynamicStateNames = {{
+    ''')
+        out.write(name_entries)
+        out.write('''
+}};
 
-        output += '''
 const char* DynamicStateToString(CBDynamicState dynamic_state) {
-    return string_VkDynamicState(ConvertToDynamicState(dynamic_state));
+    const size_t index = static_cast<size_t>(dynamic_state);
+    return (index < kCBDynamicStateNames.size()) ? kCBDynamicStateNames[index] : kCBDynamicStateNames[0];
 }
 
 std::string DynamicStatesToString(CBDynamicFlags const &dynamic_states) {
-    std::string ret;
-    // enum is not zero based
-    for (int index = 1; index < CB_DYNAMIC_STATE_STATUS_NUM; ++index) {
-        CBDynamicState status = static_cast<CBDynamicState>(index);
-        if (dynamic_states[status]) {
-            if (!ret.empty()) ret.append("|");
-            ret.append(string_VkDynamicState(ConvertToDynamicState(status)));
+    std::string ret;\n''')
+        # Every name plus a separator, so appending never reallocates
+        max_len = sum(len(name) for name in self.dynamic_states) + len(self.dynamic_states)
+        out.write(f'    ret.reserve({max_len});\n')
+        out.write('''    // Only visit the set bits, 32 at a time
+    const CBDynamicFlags word_mask(0xFFFFFFFFu);
+    for (uint32_t base = 0; base < CB_DYNAMIC_STATE_STATUS_NUM; base += 32) {
+        uint32_t bits = static_cast<uint32_t>(((dynamic_states >> base) & word_mask).to_ulong());
+        if (base == 0) bits &= ~1u;  // enum is not zero based
+        while (bits != 0) {
+            CBDynamicState status = static_cast<CBDynamicState>(base + LeastSignificantBit(bits));
+            bits &= bits - 1;
+            ret.append(kCBDynamicStateNames[status]);
+            ret.push_back('|');
         }
     }
-    if (ret.empty()) ret.append(string_VkDynamicState(ConvertToDynamicState(CB_DYNAMIC_STATE_STATUS_NUM)));
+    if (ret.empty()) {
+        ret.append(DynamicStateToString(CB_DYNAMIC_STATE_STATUS_NUM));
+    } else {
+        ret.pop_back();  // trailing separator
+    }
     return ret;
 }
-'''
-        return output
+
+''')
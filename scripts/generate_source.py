@@ -83,8 +83,7 @@ def main(argv):
                                               "spirv_grammar_helper.h",
                                               "command_validation.cpp",
                                               "command_validation.h",
-                                              "dynamic_state_helper.cpp",
-                                              "dynamic_state_helper.h",
+                                              "dynamic_state_helper.h", # also writes dynamic_state_helper.cpp
                                               "vk_format_utils.cpp",
                                               "vk_format_utils.h"]],
                 [common_codegen.repo_relative('scripts/vk_validation_stats.py'),
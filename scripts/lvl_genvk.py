@@ -627,13 +627,14 @@ def makeGenOpts(args):
             directory         = directory)
         ]
 
-    # generator for command_validation.h
+    # generator for dynamic_state_helper.h, also writes dynamic_state_helper.cpp from the same registry load
     genOpts['dynamic_state_helper.h'] = [
           DynamicStateOutputGenerator,
           DynamicStateOutputGeneratorOptions(
             conventions       = conventions,
             filename          = 'dynamic_state_helper.h',
-            directory         = directory)
+            directory         = directory,
+            sourceFilename    = 'dynamic_state_helper.cpp')
         ]
 
     # Options for format_utils code-generated header
@@ -735,6 +736,9 @@ if __name__ == '__main__':
     parser.add_argument('-diagfile', action='store',
                         default=None,
                         help='Write diagnostics to specified file')
+    parser.add_argument('-depfile', action='store',
+                        default=None,
+                        help='Write a Makefile style depfile listing vk.xml and the loaded scripts')
     parser.add_argument('-errfile', action='store',
                         default=None,
                         help='Write errors and warnings to specified file instead of stderr')
@@ -853,3 +857,15 @@ if __name__ == '__main__':
         reg.apiGen()
         endTimer(args.time, '* Time to generate ' + options.filename + ' =')
         genTarget(args)
+
+    # Everything imported from this repo or the registry can change the output, not just the generator itself
+    if (args.depfile):
+        script_dirs = tuple(os.path.join(os.path.abspath(path), '') for path in (scripts_directory_path, registry_headers_path))
+        module_paths = (os.path.abspath(module.__file__) for module in list(sys.modules.values()) if getattr(module, '__file__', None))
+        deps = [os.path.abspath(args.registry)] + sorted(path for path in module_paths if path.startswith(script_dirs))
+        target = os.path.abspath(os.path.join(args.directory, options.filename))
+        with open(args.depfile, 'w', encoding='utf-8', newline='\n') as fd:
+            fd.write(target.replace(' ', '\\ ') + ':')
+            for dep in deps:
+                fd.write(' \\\n    ' + dep.replace(' ', '\\ '))
+            fd.write('\n')